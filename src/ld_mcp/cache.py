@@ -1,33 +1,109 @@
-"""In-memory cache with TTL for fetched specs and namespace graphs."""
+"""In-memory and on-disk caches with TTL for fetched specs and namespace graphs."""
 
+import os
 import time
+from pathlib import Path
 from typing import Any, Optional
 
+from cachetools import TTLCache
+
+from ld_mcp.config import settings
+
 
 class InMemoryCache:
-    """Simple TTL cache for fetched specs and namespace graphs."""
+    """Bounded LRU cache with TTL for fetched specs and namespace graphs.
+
+    Backed by `cachetools.TTLCache`, which drops expired entries on every write,
+    so stale values for keys that are never read again don't linger.
+    """
 
-    def __init__(self, ttl: int = 86400):
-        self._store: dict[str, tuple[float, Any]] = {}
+    def __init__(self, ttl: int = 86400, maxsize: int = 64):
+        self._store: TTLCache[str, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
         self.ttl = ttl
+        self.maxsize = maxsize
 
     def get(self, key: str) -> Optional[Any]:
-        """Get value if exists and not expired."""
-        if key not in self._store:
-            return None
-        timestamp, value = self._store[key]
-        if time.time() - timestamp > self.ttl:
-            del self._store[key]
-            return None
-        return value
+        """Get value if exists and not expired, marking it as recently used."""
+        return self._store.get(key)
 
     def set(self, key: str, value: Any) -> None:
-        """Store value with current timestamp."""
-        self._store[key] = (time.time(), value)
+        """Store value with current timestamp, evicting if the cache is full."""
+        self._store[key] = value
 
     def clear(self) -> None:
         """Clear all cached entries."""
         self._store.clear()
 
 
-cache = InMemoryCache()
+class DiskCache:
+    """File-backed TTL cache (by mtime) that persists fetched documents across restarts."""
+
+    def __init__(self, directory: Optional[Path], ttl: int = 86400):
+        self.directory = directory
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a cache directory is configured."""
+        return self.directory is not None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Read the stored bytes for a relative path key if present and not expired."""
+        if self.directory is None:
+            return None
+        path = self.directory / key
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def get_stale(self, key: str) -> Optional[bytes]:
+        """Read the stored bytes for a key even if expired (e.g. to revalidate them)."""
+        if self.directory is None:
+            return None
+        try:
+            return (self.directory / key).read_bytes()
+        except OSError:
+            return None
+
+    def touch(self, key: str) -> None:
+        """Restart an existing entry's TTL, e.g. once the origin confirmed it is unchanged."""
+        if self.directory is None:
+            return
+        try:
+            os.utime(self.directory / key)
+        except OSError:
+            pass
+
+    def set(self, key: str, data: bytes) -> bool:
+        """Write bytes under a relative path key (atomically, best effort).
+
+        Returns whether the entry was written.
+        """
+        if self.directory is None:
+            return False
+        path = self.directory / key
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except OSError:
+            return False  # A read-only or full disk should not break serving from memory
+        return True
+
+
+cache = InMemoryCache(ttl=settings.cache_ttl, maxsize=settings.cache_maxsize)
+
+# Parsed HTML trees are large, so they are only kept briefly; the raw HTML lives in `cache`
+soup_cache = InMemoryCache(ttl=300, maxsize=8)
+
+# Rendered tool output is small and cheap to keep, so it gets its own, roomier cache
+md_cache = InMemoryCache(ttl=settings.cache_ttl, maxsize=256)
+
+disk_cache = DiskCache(
+    Path(settings.cache_dir).expanduser() if settings.cache_dir else None,
+    ttl=settings.cache_ttl,
+)
@@ -1,12 +1,22 @@
 """Configuration for the Linked Data MCP server."""
 
+from functools import cached_property, lru_cache
 from importlib.resources import files
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
 import yaml
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ld_mcp.models import SpecFamily
+
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 class Settings(BaseSettings):
@@ -17,9 +27,16 @@ class Settings(BaseSettings):
         SPEC_VERSIONS: Comma-separated list of versions to include (e.g., "1.1,1.2")
                        If not set, all versions are included.
         CACHE_TTL: Cache TTL in seconds. Default: 86400 (24 hours)
+        CACHE_MAXSIZE: Maximum number of entries kept in the in-memory cache. Default: 64
+        CACHE_DIR: Directory for a persistent on-disk cache of fetched specs.
+                   If not set, only the in-memory cache is used.
         INDEX_PATH: Path to a custom index.yaml file. Falls back to bundled default.
+        WARMUP: Prefetch all spec documents in the background at startup. Default: false
     """
 
+    # Read from the environment once at startup and never changed afterwards
+    model_config = SettingsConfigDict(frozen=True)
+
     spec_versions: Optional[str] = Field(
         default=None,
         alias="SPEC_VERSIONS",
@@ -32,26 +49,43 @@ class Settings(BaseSettings):
         description="Cache TTL in seconds (for in-memory cache)",
     )
 
+    cache_maxsize: int = Field(
+        default=64,
+        alias="CACHE_MAXSIZE",
+        description="Maximum number of entries in the in-memory cache (LRU eviction)",
+    )
+
+    cache_dir: Optional[str] = Field(
+        default=None,
+        alias="CACHE_DIR",
+        description="Directory for persistent cache of fetched specs (disabled if unset)",
+    )
+
     index_path: Optional[str] = Field(
         default=None,
         alias="INDEX_PATH",
         description="Path to a custom index.yaml file (overrides bundled default)",
     )
 
-    @property
-    def allowed_versions(self) -> Optional[set[str]]:
-        """Parse spec_versions into a set, or None if all versions allowed."""
+    warmup: bool = Field(
+        default=False,
+        alias="WARMUP",
+        description="Prefetch all spec documents in the background at startup",
+    )
+
+    @cached_property
+    def allowed_versions(self) -> Optional[frozenset[str]]:
+        """Parse spec_versions into a set (once), or None if all versions allowed."""
         if self.spec_versions is None:
             return None
-        return {v.strip() for v in self.spec_versions.split(",") if v.strip()}
+        return frozenset(v.strip() for v in self.spec_versions.split(",") if v.strip())
 
     def version_allowed(self, version: Optional[str]) -> bool:
         """Check if a specification version should be included."""
-        if self.allowed_versions is None:
+        allowed = self.allowed_versions
+        if allowed is None or version is None:
             return True
-        if version is None:
-            return True
-        return version in self.allowed_versions
+        return version in allowed
 
 
 settings = Settings()
@@ -67,18 +101,41 @@ def get_index_path() -> Path:
     return Path(str(files("ld_mcp").joinpath("index.yaml")))
 
 
+@lru_cache(maxsize=1)
 def load_index() -> dict:
-    """Load the specification index from index.yaml."""
-    with open(get_index_path()) as f:
-        return yaml.safe_load(f)
+    """Load the specification index from index.yaml (read once per process)."""
+    with open(get_index_path(), "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _partition_by_version(specs: list[dict]) -> dict[Optional[str], list[tuple[int, dict]]]:
+    """Group specs by version, keeping each spec's position in the index."""
+    by_version: dict[Optional[str], list[tuple[int, dict]]] = {}
+    for pos, spec in enumerate(specs):
+        by_version.setdefault(spec.get("version"), []).append((pos, spec))
+    return by_version
+
+
+def _select_versions(specs: list[dict]) -> list[dict]:
+    """Pick the specs for the allowed versions (plus unversioned ones) in index order."""
+    allowed = settings.allowed_versions
+    if allowed is None:
+        return list(specs)
+    by_version = _partition_by_version(specs)
+    picked = [entry for v in (None, *allowed) for entry in by_version.get(v, ())]
+    picked.sort(key=itemgetter(0))
+    return [spec for _, spec in picked]
 
 
-def get_filtered_index() -> dict:
+@lru_cache(maxsize=1)
+def get_filtered_index() -> dict[str, SpecFamily]:
     """
     Load index.yaml and filter specifications based on SPEC_VERSIONS.
 
-    Returns the index with specs filtered according to the version setting.
-    Specs without a version field are always included.
+    Returns the index as typed SpecFamily models, with specs filtered according
+    to the version setting. Specs without a version field are always included.
+
+    The result is memoized and shared between callers, so it must not be mutated.
     """
     index = load_index()
 
@@ -87,21 +144,10 @@ def get_filtered_index() -> dict:
         if not isinstance(family_data, dict):
             continue
 
-        filtered_family = {
-            "comment": family_data.get("comment", ""),
-        }
-
-        if "specifications" in family_data:
-            filtered_specs = [
-                spec
-                for spec in family_data["specifications"]
-                if settings.version_allowed(spec.get("version"))
-            ]
-            filtered_family["specifications"] = filtered_specs
-
-        if "namespaces" in family_data:
-            filtered_family["namespaces"] = family_data["namespaces"]
-
-        result[family_key] = filtered_family
+        result[family_key] = SpecFamily(
+            comment=family_data.get("comment", ""),
+            specifications=_select_versions(family_data.get("specifications") or []),
+            namespaces=family_data.get("namespaces") or [],
+        )
 
     return result
@@ -1,23 +1,70 @@
 """HTTP client and fetch utilities."""
 
+import asyncio
 import re
+from typing import Optional
 
 import httpx
-from html_to_markdown import ConversionOptions, convert
+from bs4 import BeautifulSoup, SoupStrainer
+from html_to_markdown import ConversionOptions, convert_with_handle, create_options_handle
 
+# Prefer the C-backed lxml tree builder; fall back to the pure-Python parser if unavailable
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Specs mostly live on www.w3.org, so keep connections alive and multiplex them over HTTP/2
 http_client = httpx.AsyncClient(
-    timeout=30.0,
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(
+        max_connections=40, max_keepalive_connections=20, keepalive_expiry=60.0
+    ),
     follow_redirects=True,
     headers={"User-Agent": "ld-mcp/1.0 (Linked Data MCP Server)"},
 )
 
 
-async def fetch_html(url: str) -> str:
-    """Fetch HTML content from a URL."""
+# Prefer formats rdflib parses quickly; RDF/XML is what most W3C namespaces serve anyway
+RDF_ACCEPT = "text/turtle, application/n-triples;q=0.9, application/rdf+xml;q=0.8, */*;q=0.1"
+
+
+# Concurrent requests per host (e.g. a warmup fanning out to www.w3.org); the client's pool
+# limit still bounds the total, this keeps one host from taking all of it or throttling us
+_HOST_CONCURRENCY = 6
+# Semaphores bind to the loop they first wait on, so keep one set per running loop
+_host_limits: dict[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = {}
+
+
+def _host_limit(url: str) -> asyncio.Semaphore:
+    """The semaphore shared by all requests to the URL's host on the running loop."""
+    loop = asyncio.get_running_loop()
+    if (limits := _host_limits.get(loop)) is None:
+        for closed in [other for other in _host_limits if other.is_closed()]:
+            del _host_limits[closed]  # Drop semaphores of loops that have finished
+        limits = _host_limits[loop] = {}
+    host = httpx.URL(url).host
+    if (limit := limits.get(host)) is None:
+        limit = limits[host] = asyncio.Semaphore(_HOST_CONCURRENCY)
+    return limit
+
+
+async def _get(
+    url: str, headers: Optional[dict[str, str]] = None, allow_not_modified: bool = False
+) -> httpx.Response:
+    """GET a URL with the shared client, turning failures into readable errors.
+
+    Set `allow_not_modified` for conditional requests, whose 304 answer is a success.
+    """
     try:
-        response = await http_client.get(url)
-        response.raise_for_status()
-        return response.text
+        async with _host_limit(url):
+            response = await http_client.get(url, headers=headers)
+        if not (allow_not_modified and response.status_code == 304):
+            response.raise_for_status()
+        return response
     except httpx.HTTPStatusError as e:
         raise Exception(f"HTTP error {e.response.status_code} fetching {url}")
     except httpx.TimeoutException:
@@ -26,12 +73,68 @@ async def fetch_html(url: str) -> str:
         raise Exception(f"Error fetching {url}: {str(e)}")
 
 
-# Configure markdown conversion for clean MCP output
-_md_options = ConversionOptions(
-    heading_style="atx",  # Use # style headings (cleaner)
-    code_block_style="fenced",  # Use ``` fenced code blocks
+async def fetch_html(url: str) -> bytes:
+    """Fetch raw HTML bytes from a URL (decoding is left to the parser)."""
+    return (await _get(url)).content
+
+
+def media_type(response: httpx.Response) -> Optional[str]:
+    """The response's media type without parameters, lowercased (or None)."""
+    content_type = response.headers.get("content-type")
+    value = content_type.split(";", 1)[0].strip().lower() if content_type else None
+    return value or None
+
+
+async def fetch_rdf(url: str) -> tuple[bytes, Optional[str]]:
+    """Fetch an RDF document, returning its raw bytes and media type (if any)."""
+    response = await _get(url, headers={"Accept": RDF_ACCEPT})
+    return response.content, media_type(response)
+
+
+async def fetch_if_modified(
+    url: str, validators: Optional[dict[str, str]] = None, accept: Optional[str] = None
+) -> tuple[Optional[bytes], Optional[str], dict[str, str]]:
+    """Fetch a document, revalidating a stored copy with a conditional GET.
+
+    `validators` are the headers returned by a previous call for the stored copy.
+    Returns the content, its media type and validators to keep for next time;
+    content is None if the server answered 304 Not Modified (the stored copy is current).
+    """
+    headers = dict(validators or {})
+    if accept:
+        headers["Accept"] = accept
+    response = await _get(url, headers=headers, allow_not_modified=bool(validators))
+    if validators and response.status_code == 304:
+        return None, None, validators
+
+    new_validators = {}
+    if etag := response.headers.get("etag"):
+        new_validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("last-modified"):
+        new_validators["If-Modified-Since"] = last_modified
+    return response.content, media_type(response), new_validators
+
+
+def parse_html(html: bytes | str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML into a BeautifulSoup tree (lxml when installed).
+
+    Bytes are decoded by the parser, using the document's declared charset.
+    Pass `parse_only` to build just the matching parts of the document.
+    """
+    return BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+
+
+# Configure markdown conversion for clean MCP output; the handle keeps the options
+# converted on the Rust side, so each section conversion only ships the HTML across
+_md_options = create_options_handle(
+    ConversionOptions(
+        heading_style="atx",  # Use # style headings (cleaner)
+        code_block_style="fenced",  # Use ``` fenced code blocks
+    )
 )
 
+_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 def html_to_markdown(html: str) -> str:
     """Convert HTML content to Markdown.
@@ -43,7 +146,7 @@ def html_to_markdown(html: str) -> str:
     # See: https://github.com/kreuzberg-dev/html-to-markdown/issues
     sanitized = html.replace("\u00a0", " ").replace("&nbsp;", " ")
 
-    md = convert(sanitized, _md_options)
-    md = re.sub(r"\n{3,}", "\n\n", md)  # Max 2 consecutive newlines
+    md = convert_with_handle(sanitized, _md_options)
+    md = _NEWLINES_RE.sub("\n\n", md)  # Max 2 consecutive newlines
 
     return md.strip()
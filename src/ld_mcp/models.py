@@ -4,12 +4,14 @@ Data models for the Linked Data MCP server.
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # --- Index Models ---
 
 class Specification(BaseModel):
     """A single specification document."""
+    model_config = ConfigDict(frozen=True)
+
     key: str = Field(description="Short identifier for the spec (e.g., 'rdf12-primer')")
     label: str = Field(description="Human-readable title")
     comment: str = Field(description="Brief description of the specification")
@@ -19,6 +21,8 @@ class Specification(BaseModel):
 
 class Namespace(BaseModel):
     """A vocabulary namespace with defined resources."""
+    model_config = ConfigDict(frozen=True)
+
     key: str = Field(description="Short prefix (e.g., 'rdf', 'rdfs', 'owl')")
     label: str = Field(description="Human-readable name")
     comment: str = Field(description="Description of what the namespace defines")
@@ -28,6 +32,8 @@ class Namespace(BaseModel):
 
 class SpecFamily(BaseModel):
     """A family of related specifications (e.g., RDF, SPARQL, OWL)."""
+    model_config = ConfigDict(frozen=True)
+
     comment: str = Field(description="Description of the specification family")
     specifications: list[Specification] = Field(default_factory=list)
     namespaces: list[Namespace] = Field(default_factory=list)
@@ -36,15 +42,25 @@ class SpecFamily(BaseModel):
 
 class TOCItem(BaseModel):
     """A single item in a specification's table of contents."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Section identifier (used for get_section)")
     title: str = Field(description="Section title")
     depth: int = Field(description="Nesting depth (1 = top level)")
     anchor: Optional[str] = Field(default=None, description="HTML anchor/fragment")
     children: list["TOCItem"] = Field(default_factory=list)
 
+    @classmethod
+    def from_cache(cls, data: dict) -> "TOCItem":
+        """Rebuild an item from our own serialized TOC without re-validating it."""
+        data["children"] = [cls.from_cache(child) for child in data.get("children", ())]
+        return cls.model_construct(**data)
+
 
 class CachedSpec(BaseModel):
     """Cached specification with TOC and content sections."""
+    model_config = ConfigDict(frozen=True)
+
     key: str
     uri: str
     fetched_at: str = Field(description="ISO timestamp of when content was fetched")
@@ -59,6 +75,8 @@ class CachedSpec(BaseModel):
 
 class NamespaceResource(BaseModel):
     """A resource (class, property, etc.) defined in a namespace."""
+    model_config = ConfigDict(frozen=True)
+
     uri: str = Field(description="Full URI of the resource")
     local_name: str = Field(description="Local name (e.g., 'type' from rdf:type)")
     types: list[str] = Field(default_factory=list, description="rdf:type values")
@@ -1,32 +1,43 @@
 """Parsers for W3C specifications and RDF namespaces."""
 
-from ld_mcp.parsers.content import extract_section_content
+from ld_mcp.parsers.content import extract_section_content, extract_section_content_html
 from ld_mcp.parsers.namespace import (
     NAMESPACES,
+    Resource,
     extract_resources,
     fetch_namespace_graph,
     get_resource_turtle,
+    graph_from_ntriples,
+    graph_to_ntriples,
+    parse_namespace_graph,
 )
 from ld_mcp.parsers.toc import (
     flatten_toc,
     parse_headings_as_toc,
     parse_sections_as_toc,
     parse_w3c_toc,
+    parse_w3c_toc_html,
     toc_to_markdown,
 )
 
 __all__ = [
     # TOC parsing
     "parse_w3c_toc",
+    "parse_w3c_toc_html",
     "parse_sections_as_toc",
     "parse_headings_as_toc",
     "flatten_toc",
     "toc_to_markdown",
     # Content extraction
     "extract_section_content",
+    "extract_section_content_html",
     # Namespace parsing
     "NAMESPACES",
     "fetch_namespace_graph",
+    "parse_namespace_graph",
+    "Resource",
     "extract_resources",
     "get_resource_turtle",
+    "graph_to_ntriples",
+    "graph_from_ntriples",
 ]
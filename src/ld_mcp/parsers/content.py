@@ -2,9 +2,29 @@
 
 from typing import Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
-from ld_mcp.fetch import html_to_markdown
+from ld_mcp.fetch import html_to_markdown, parse_html
+
+_CONTAINER_TAGS = ("section", "div")
+_HEADING_LIST = ["h1", "h2", "h3", "h4", "h5", "h6"]
+_H_LEVEL = {name: int(name[1]) for name in _HEADING_LIST}
+
+
+def _heading_section_html(heading: Tag) -> str:
+    """HTML of a heading plus its following sibling elements, up to the next same-level heading."""
+    heading_level = _H_LEVEL[heading.name]
+    content_parts = [heading]
+
+    for sibling in heading.next_siblings:
+        if not isinstance(sibling, Tag):
+            continue
+        level = _H_LEVEL.get(sibling.name)
+        if level is not None and level <= heading_level:
+            break
+        content_parts.append(sibling)
+
+    return "".join(map(str, content_parts))
 
 
 def extract_section_content(soup: BeautifulSoup, section_id: str) -> Optional[str]:
@@ -19,37 +39,33 @@ def extract_section_content(soup: BeautifulSoup, section_id: str) -> Optional[st
         return None
 
     # If it's a section/div element, get its content directly
-    if section.name in ["section", "div"]:
+    if section.name in _CONTAINER_TAGS:
         return html_to_markdown(str(section))
 
     # If it's a heading, collect content until next same-level heading
-    if section.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-        heading_level = int(section.name[1])
-        content_parts = [str(section)]
-
-        for sibling in section.find_next_siblings():
-            if sibling.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                sibling_level = int(sibling.name[1])
-                if sibling_level <= heading_level:
-                    break
-            content_parts.append(str(sibling))
-
-        return html_to_markdown("".join(content_parts))
+    if section.name in _H_LEVEL:
+        return html_to_markdown(_heading_section_html(section))
 
     # If it's an anchor (common in older specs), find the next heading and extract from there
     if section.name == "a":
-        next_heading = section.find_next(["h1", "h2", "h3", "h4", "h5", "h6"])
+        next_heading = section.find_next(_HEADING_LIST)
         if next_heading:
-            heading_level = int(next_heading.name[1])
-            content_parts = [str(next_heading)]
+            return html_to_markdown(_heading_section_html(next_heading))
+
+    return html_to_markdown(str(section))
 
-            for sibling in next_heading.find_next_siblings():
-                if sibling.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                    sibling_level = int(sibling.name[1])
-                    if sibling_level <= heading_level:
-                        break
-                content_parts.append(str(sibling))
 
-            return html_to_markdown("".join(content_parts))
+def extract_section_content_html(html: bytes | str, section_id: str) -> Optional[str]:
+    """
+    Extract a section straight from raw HTML, building only the elements with that id.
 
+    Handles ids on <section>/<div> containers (ReSpec-style specs). Returns None for
+    anything else, in which case the caller should parse the full document and use
+    `extract_section_content`, which can walk headings and anchors.
+    """
+    section = parse_html(html, parse_only=SoupStrainer(attrs={"id": section_id})).find(
+        id=section_id
+    )
+    if section is None or section.name not in _CONTAINER_TAGS:
+        return None
     return html_to_markdown(str(section))
@@ -1,6 +1,16 @@
 """RDF namespace parsing utilities using rdflib."""
 
-from rdflib import RDF, Graph, URIRef
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import NamedTuple, Optional
+
+from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef, plugin
+from rdflib.parser import Parser
+from rdflib.term import Node
+from rdflib.util import guess_format
 
 # Standard namespace prefixes
 NAMESPACES = {
@@ -15,41 +25,198 @@ NAMESPACES = {
 }
 
 
-def fetch_namespace_graph(uri: str) -> Graph:
-    """Fetch and parse namespace RDF with standard prefix bindings."""
+def _standard_bindings() -> tuple[tuple[str, URIRef], ...]:
+    """Resolve rdflib's default prefixes plus ours once, the way `Graph.bind` would."""
     g = Graph()
     for prefix, ns in NAMESPACES.items():
         g.bind(prefix, ns)
+    return tuple(g.namespaces())
+
+
+_STANDARD_BINDINGS = _standard_bindings()
+
+
+def _new_graph() -> Graph:
+    """Create an empty graph with the standard prefix bindings."""
+    g = Graph(bind_namespaces="none")
+    for prefix, ns in _STANDARD_BINDINGS:
+        g.store.bind(prefix, ns)  # Already validated, so skip the namespace manager
+    return g
+
+
+# Openings of an RDF/XML document (a bare "<" is no hint: Turtle may start with an <iri>)
+_RDF_XML_STARTS = (b"<?xml", b"<!--", b"<rdf:RDF", b"<!DOCTYPE rdf:RDF")
+
+
+def _rdf_format(media_type: Optional[str], uri: str, data: bytes = b"") -> Optional[str]:
+    """Pick an rdflib parser from the media type, else the URI's extension, else the content.
+
+    Vague media types (text/plain, application/octet-stream) would otherwise leave rdflib
+    to try Turtle, which fails outright on the RDF/XML many vocabularies serve.
+    """
+    if media_type:
+        try:
+            plugin.get(media_type, Parser)  # rdflib registers parsers under their media types
+            return media_type
+        except plugin.PluginException:
+            pass
+    if fmt := guess_format(uri):
+        return fmt
+    head = data[:512].removeprefix(b"\xef\xbb\xbf").lstrip()
+    if b"<html" in head.lower():  # An HTML landing or error page, not RDF
+        return None
+    if head.startswith(_RDF_XML_STARTS):
+        return "xml"
+    if head.startswith((b"{", b"[")):
+        return "json-ld"
+    return None
+
+
+def fetch_namespace_graph(uri: str) -> Graph:
+    """Fetch and parse namespace RDF with standard prefix bindings."""
+    g = _new_graph()
     g.parse(uri)  # rdflib auto-detects format
     return g
 
 
-def _normalize_uri_variants(ns_uri: str) -> list[str]:
-    """Return list of URI variants (http/https) for matching."""
-    variants = [ns_uri]
+def parse_namespace_graph(data: bytes, uri: str, media_type: Optional[str] = None) -> Graph:
+    """Parse already-fetched namespace RDF with standard prefix bindings."""
+    g = _new_graph()
+    g.parse(data=data, format=_rdf_format(media_type, uri, data), publicID=uri)
+    return g
+
+
+# Prefix bindings are kept as leading comments, since N-Triples itself has no prefixes
+_PREFIX_COMMENT_RE = re.compile(rb"^# @prefix ([^:\s]*): <([^>]*)> \.$", re.M)
+
+
+def graph_to_ntriples(graph: Graph) -> bytes:
+    """Serialize a graph as N-Triples (fast to reparse), preserving its prefix bindings."""
+    header = "".join(f"# @prefix {prefix}: <{ns}> .\n" for prefix, ns in graph.namespaces())
+    return header.encode("utf-8") + graph.serialize(format="nt", encoding="utf-8")
+
+
+def graph_from_ntriples(data: bytes) -> Graph:
+    """Rebuild a graph written by `graph_to_ntriples`, with the same prefix bindings."""
+    g = Graph(bind_namespaces="none")
+    for m in _PREFIX_COMMENT_RE.finditer(data):
+        g.bind(m[1].decode("utf-8"), m[2].decode("utf-8"), override=True, replace=True)
+    g.parse(data=data, format="nt")
+    return g
+
+
+@lru_cache(maxsize=32)
+def _normalize_uri_variants(ns_uri: str) -> tuple[str, ...]:
+    """Return URI variants (http/https) for matching."""
     if ns_uri.startswith("https://"):
-        variants.append(ns_uri.replace("https://", "http://"))
-    elif ns_uri.startswith("http://"):
-        variants.append(ns_uri.replace("http://", "https://"))
-    return variants
+        return ns_uri, ns_uri.replace("https://", "http://")
+    if ns_uri.startswith("http://"):
+        return ns_uri, ns_uri.replace("http://", "https://")
+    return (ns_uri,)
+
+
+class Resource(NamedTuple):
+    """A resource defined in a namespace: its local name and first rdf:type (as a qname)."""
 
+    name: str
+    a: Optional[str]
 
-def extract_resources(graph: Graph, ns_uri: str) -> list[dict]:
+
+def extract_resources(graph: Graph, ns_uri: str) -> list[Resource]:
     """Extract resources defined in namespace, sorted by name."""
     uri_variants = _normalize_uri_variants(ns_uri)
 
     resources = []
-    for s in set(graph.subjects()):
+    for s in graph.subjects(unique=True):
         s_str = str(s)
-        for uri in uri_variants:
-            if s_str.startswith(uri):
-                local = s_str[len(uri) :]
-                if not local:  # Skip the namespace itself (e.g., owl:Ontology)
-                    break
-                types = [graph.qname(t) for t in graph.objects(s, RDF.type)]
-                resources.append({"name": local, "a": types[0] if types else None})
-                break
-    return sorted(resources, key=lambda r: r["name"])
+        if not s_str.startswith(uri_variants):
+            continue
+        base = next(uri for uri in uri_variants if s_str.startswith(uri))
+        local = s_str[len(base) :]
+        if not local:  # Skip the namespace itself (e.g., owl:Ontology)
+            continue
+        rdf_type = next(graph.objects(s, RDF.type), None)
+        resources.append(Resource(local, graph.qname(rdf_type) if rdf_type else None))
+    return sorted(resources, key=attrgetter("name"))
+
+
+# Prefix table matching the subgraphs the Turtle fallback serializes (rdflib defaults + ours)
+_TURTLE_PREFIXES = _new_graph()
+_PREDICATE_ORDER = (RDF.type, RDFS.label)
+_PERCENT_RE = re.compile(r"%(?![0-9A-Fa-f]{2})")
+# rdflib's own literal writer is private; without it every resource goes through rdflib
+_LITERAL_N3 = getattr(Literal, "_literal_n3", None)
+
+
+def _pname(uri: URIRef) -> Optional[str]:
+    """Prefixed name for a URI, written the way rdflib's Turtle serializer does (or None)."""
+    try:
+        prefix, _, local = _TURTLE_PREFIXES.compute_qname(uri, generate=False)
+    except (KeyError, ValueError):
+        # Is the URI a namespace in itself?
+        prefix = _TURTLE_PREFIXES.store.prefix(uri)
+        if prefix is None:
+            return None
+        local = ""
+    local = _PERCENT_RE.sub(r"\\%", local.replace("(", r"\(").replace(")", r"\)"))
+    if local.endswith("."):
+        return None
+    return f"{prefix}:{local}"
+
+
+def _turtle_term(node: Node) -> str:
+    """Turtle for a subject or object term (URI or literal)."""
+    if node == RDF.nil:
+        return "()"
+    if isinstance(node, Literal):
+        return _LITERAL_N3(node, use_plain=True, qname_callback=_pname)
+    return _pname(node) or node.n3()
+
+
+def _write_turtle(triples: Iterable[tuple[Node, Node, Node]]) -> Optional[str]:
+    """
+    Write a small set of triples as Turtle without building a graph to serialize.
+
+    Produces the same layout as rdflib's Turtle serializer (minus @prefix lines).
+    Returns None when that would need blank node nesting or generated prefixes,
+    which are left to rdflib, or when this rdflib lacks the literal writer.
+    """
+    if _LITERAL_N3 is None:
+        return None
+    by_subject: dict[Node, dict[Node, list[Node]]] = {}
+    references: dict[Node, int] = {}
+    for s, p, o in triples:
+        if isinstance(s, BNode) or isinstance(o, BNode):
+            return None
+        by_subject.setdefault(s, {}).setdefault(p, []).append(o)
+        references[o] = references.get(o, 0) + 1
+
+    # rdfs:Class instances first, then by how often the subject is referenced
+    classes = sorted(s for s, props in by_subject.items() if RDFS.Class in props.get(RDF.type, ()))
+    seen = set(classes)
+    others = sorted((references.get(s, 0), s) for s in by_subject if s not in seen)
+
+    statements = []
+    for subject in classes + [s for _, s in others]:
+        props = by_subject[subject]
+        ordered = [p for p in _PREDICATE_ORDER if p in props]
+        ordered += sorted(p for p in props if p not in _PREDICATE_ORDER)
+        parts = []
+        for p in ordered:
+            if p == RDF.type:
+                verb = "a"
+            elif p == RDF.nil:
+                verb = "()"
+            else:
+                try:
+                    _TURTLE_PREFIXES.compute_qname(p, generate=False)
+                except (KeyError, ValueError):
+                    return None  # rdflib would generate an ns1-style prefix for it
+                verb = _pname(p) or p.n3()
+            objects = ",\n        ".join(_turtle_term(o) for o in sorted(props[p]))
+            parts.append(f"{verb} {objects}")
+        statements.append(f"{_turtle_term(subject)} " + " ;\n    ".join(parts) + " .")
+    return "\n\n".join(statements)
 
 
 def get_resource_turtle(
@@ -64,29 +231,28 @@ def get_resource_turtle(
         subject_only: If True, only return triples where resource is subject.
                       If False, include triples where resource appears as predicate or object.
     """
-    uri_variants = _normalize_uri_variants(ns_uri)
-    uris = set(URIRef(uri_base + local_name) for uri_base in uri_variants)
+    # A dict keeps first-seen order, so the rdflib fallback sees the triples as before
+    triples: dict[tuple[Node, Node, Node], None] = {}
+    uris = [URIRef(uri_base + local_name) for uri_base in _normalize_uri_variants(ns_uri)]
+    # Resource as subject (always included), then as predicate and as object;
+    # each position probes all URI variants in a single triples_choices call
+    patterns = [(uris, None, None)]
+    if not subject_only:
+        patterns += [(None, uris, None), (None, None, uris)]
+    triples.update(dict.fromkeys(chain.from_iterable(map(graph.triples_choices, patterns))))
 
-    subgraph = Graph()
-    for prefix, ns in NAMESPACES.items():
-        subgraph.bind(prefix, ns)
-
-    for uri in uris:
-        # Resource as subject (always included)
-        for p, o in graph.predicate_objects(subject=uri):
-            subgraph.add((uri, p, o))
-
-        if not subject_only:
-            # Resource as predicate
-            for s, o in graph.subject_objects(predicate=uri):
-                subgraph.add((s, uri, o))
-            # Resource as object
-            for s, p in graph.subject_predicates(object=uri):
-                subgraph.add((s, p, uri))
-
-    if len(subgraph) == 0:
+    if not triples:
         return ""
 
+    turtle = _write_turtle(triples)
+    if turtle is not None:
+        return turtle
+
+    # Blank nodes (nested [ ] / lists) and unknown prefixes: let rdflib lay them out
+    subgraph = _new_graph()
+    for triple in triples:
+        subgraph.add(triple)
     turtle = subgraph.serialize(format="turtle")
-    lines = [line for line in turtle.splitlines() if not line.startswith("@prefix")]
-    return "\n".join(lines).strip()
+    if turtle.startswith("@prefix"):
+        turtle = turtle.partition("\n\n")[2]  # The prefix header ends at the first blank line
+    return turtle.strip()
@@ -3,10 +3,15 @@
 import re
 from typing import Optional
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
+from ld_mcp.fetch import parse_html
 from ld_mcp.models import TOCItem
 
+_APPENDIX_RE = re.compile(r"^[A-Z]\.")  # Appendix numbering, e.g. "A. Acknowledgements"
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_TOC_HEADING_RE = re.compile(r"Table of Contents", re.I)
+
 
 def parse_sections_as_toc(soup: BeautifulSoup, skip_acknowledgements: bool = True) -> list[TOCItem]:
     """
@@ -64,7 +69,7 @@ def parse_headings_as_toc(soup: BeautifulSoup, skip_acknowledgements: bool = Tru
             continue
 
         if skip_acknowledgements and (
-            re.match(r"^[A-Z]\.", title) or "acknowledgment" in title.lower()
+            _APPENDIX_RE.match(title) or "acknowledgment" in title.lower()
         ):
             continue
 
@@ -99,37 +104,83 @@ def _parse_toc_paragraph(p_tag: Tag) -> list[TOCItem]:
     return items
 
 
+_LIST_TAGS = ("ol", "ul")
+
+
 def _parse_toc_list(
     ol_or_ul: Tag, depth: int = 1, skip_acknowledgements: bool = True
 ) -> list[TOCItem]:
-    """Recursively parse a TOC list (ol/ul)."""
-    items = []
-    for li in ol_or_ul.find_all("li", recursive=False):
-        link = li.find("a", recursive=False) or li.find("a")
-        if not link:
-            continue
+    """Parse a (nested) TOC list (ol/ul), walking sublists with an explicit stack."""
+    items: list[TOCItem] = []
+    stack = [(ol_or_ul, depth, items)]
+    while stack:
+        current, level, siblings = stack.pop()
+        for li in current.find_all("li", recursive=False):
+            # One pass over the item's children finds its own link and nested list
+            link = nested = None
+            for child in li.children:
+                if child.name == "a":
+                    link = link or child
+                elif child.name in _LIST_TAGS:
+                    nested = nested or child
+            link = link or li.find("a")
+            if not link:
+                continue
+
+            href = link.get("href", "")
+            anchor = href.lstrip("#") if href.startswith("#") else None
+            title = link.get_text(strip=False)
+
+            if skip_acknowledgements and (
+                _APPENDIX_RE.match(title) or "acknowledgments" in title.lower()
+            ):
+                continue
+
+            section_id = anchor or _SLUG_RE.sub("-", title.lower()).strip("-")
+
+            # Built from our own parse, so skip field validation
+            item = TOCItem.model_construct(
+                id=section_id, title=title, depth=level, anchor=anchor, children=[]
+            )
+            siblings.append(item)
+
+            if nested:
+                stack.append((nested, level + 1, item.children))
 
-        href = link.get("href", "")
-        anchor = href.lstrip("#") if href.startswith("#") else None
-        title = link.get_text(strip=False)
+    return items
+
+
+# Strainers that build only the TOC container subtree out of a full spec document
+_TOC_ID_STRAINER = SoupStrainer(attrs={"id": "toc"})
+_TOC_CLASS_STRAINER = SoupStrainer(attrs={"class": "toc"})
 
-        if skip_acknowledgements and (
-            re.match(r"^[A-Z]\.", title) or "acknowledgments" in title.lower()
-        ):
-            continue
 
-        section_id = anchor or re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+def _find_toc_container_by_id(soup: BeautifulSoup) -> Optional[Tag]:
+    """Find a TOC container marked with id="toc"."""
+    for tag in ["nav", "div", "section", "table"]:
+        toc_container = soup.find(tag, id="toc")
+        if toc_container:
+            return toc_container
+    return None
 
-        item = TOCItem(id=section_id, title=title, depth=depth, anchor=anchor, children=[])
 
-        # Look for nested list (children)
-        nested = li.find(["ol", "ul"], recursive=False)
-        if nested:
-            item.children = _parse_toc_list(nested, depth + 1, skip_acknowledgements)
+def _find_toc_container_by_class(soup: BeautifulSoup) -> Optional[Tag]:
+    """Find a TOC container marked with class="toc"."""
+    return soup.find("div", class_="toc") or soup.find("nav", class_="toc")
 
-        items.append(item)
 
-    return items
+def _parse_toc_container(toc_container: Tag, skip_acknowledgements: bool = True) -> list[TOCItem]:
+    """Parse the list (or old-style paragraph) inside a TOC container."""
+    main_list = toc_container.find(["ol", "ul"])
+    if main_list:
+        return _parse_toc_list(main_list, skip_acknowledgements=skip_acknowledgements)
+
+    # Fallback: old-style <p class="toc"> with <br/> separated links
+    toc_para = toc_container.find("p", class_="toc")
+    if toc_para:
+        return _parse_toc_paragraph(toc_para)
+
+    return []
 
 
 def parse_w3c_toc(soup: BeautifulSoup, skip_acknowledgements: bool = True) -> list[TOCItem]:
@@ -141,24 +192,12 @@ def parse_w3c_toc(soup: BeautifulSoup, skip_acknowledgements: bool = True) -> li
     2. Section elements with IDs (ReSpec)
     3. Headings with IDs (older specs)
     """
-    # Try to find TOC container
-    toc_container = None
-
-    # Try by id first
-    for tag in ["nav", "div", "section", "table"]:
-        toc_container = soup.find(tag, id="toc")
-        if toc_container:
-            break
-
-    # Try by class
-    if not toc_container:
-        toc_container = soup.find("div", class_="toc")
-    if not toc_container:
-        toc_container = soup.find("nav", class_="toc")
+    # Try to find TOC container, by id first, then by class
+    toc_container = _find_toc_container_by_id(soup) or _find_toc_container_by_class(soup)
 
     # Some older specs have a heading "Table of Contents" followed by a list
     if not toc_container:
-        toc_heading = soup.find(["h2", "h3"], string=re.compile(r"Table of Contents", re.I))
+        toc_heading = soup.find(["h2", "h3"], string=_TOC_HEADING_RE)
         if toc_heading:
             next_list = toc_heading.find_next_sibling(["ol", "ul"])
             if next_list:
@@ -171,31 +210,44 @@ def parse_w3c_toc(soup: BeautifulSoup, skip_acknowledgements: bool = True) -> li
             return items
         return parse_headings_as_toc(soup, skip_acknowledgements)
 
-    # Parse TOC container
-    main_list = toc_container.find(["ol", "ul"])
-    if main_list:
-        return _parse_toc_list(main_list, skip_acknowledgements=skip_acknowledgements)
+    return _parse_toc_container(toc_container, skip_acknowledgements)
 
-    # Fallback: old-style <p class="toc"> with <br/> separated links
-    toc_para = toc_container.find("p", class_="toc")
-    if toc_para:
-        return _parse_toc_paragraph(toc_para)
 
-    return []
+def parse_w3c_toc_html(
+    html: bytes | str, skip_acknowledgements: bool = True
+) -> Optional[list[TOCItem]]:
+    """
+    Parse the TOC straight from raw HTML, building only the TOC container's subtree.
+
+    Covers specs with a nav#toc / div.toc style container, which is most of them.
+    Returns None if there is no such container, in which case the caller should
+    parse the full document and use `parse_w3c_toc`.
+    """
+    for strainer, find_container in (
+        (_TOC_ID_STRAINER, _find_toc_container_by_id),
+        (_TOC_CLASS_STRAINER, _find_toc_container_by_class),
+    ):
+        toc_container = find_container(parse_html(html, parse_only=strainer))
+        if toc_container:
+            return _parse_toc_container(toc_container, skip_acknowledgements)
+    return None
 
 
 def flatten_toc(toc: list[TOCItem], max_depth: Optional[int] = None) -> list[dict]:
-    """Flatten a nested TOC into a list of items with depth info."""
+    """Flatten a nested TOC into a list of items with depth info (in document order)."""
+    if max_depth is not None and max_depth < 1:
+        return []
     result = []
-
-    def collect(items: list[TOCItem], current_depth: int = 1):
-        for item in items:
-            if max_depth is None or current_depth <= max_depth:
-                result.append({"id": item.id, "title": item.title, "depth": item.depth})
-                if item.children:
-                    collect(item.children, current_depth + 1)
-
-    collect(toc)
+    # One iterator per open level; the stack height is the current depth
+    stack = [iter(toc)]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+        result.append({"id": item.id, "title": item.title, "depth": item.depth})
+        if item.children and (max_depth is None or len(stack) < max_depth):
+            stack.append(iter(item.children))
     return result
 
 
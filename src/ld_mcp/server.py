@@ -4,27 +4,77 @@ ld-mcp: Linked Data MCP Server
 
 Access W3C Semantic Web specifications (RDF, SPARQL, OWL, SHACL, SKOS, PROV).
 
-Env: SPEC_VERSIONS (e.g. "1.2"), CACHE_TTL (default: 86400)
+Env: SPEC_VERSIONS (e.g. "1.2"), CACHE_TTL (default: 86400), CACHE_MAXSIZE (default: 64),
+     WARMUP (default: false)
 """
 
-from typing import Annotated
+import asyncio
+import hashlib
+import importlib.util
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import Annotated, Any
 
+import anyio
 from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
+from pydantic_core import from_json, to_json
 
-from ld_mcp.cache import cache
-from ld_mcp.config import get_filtered_index
-from ld_mcp.fetch import fetch_html
+from ld_mcp.cache import cache, disk_cache, md_cache, soup_cache
+from ld_mcp.config import get_filtered_index, settings
+from ld_mcp.fetch import RDF_ACCEPT, fetch_html, fetch_if_modified, fetch_rdf, parse_html
+from ld_mcp.models import Namespace, Specification, TOCItem
 from ld_mcp.parsers import (
+    Resource,
     extract_resources,
     extract_section_content,
-    fetch_namespace_graph,
+    extract_section_content_html,
     flatten_toc,
     get_resource_turtle,
+    graph_from_ntriples,
+    graph_to_ntriples,
+    parse_namespace_graph,
     parse_w3c_toc,
+    parse_w3c_toc_html,
 )
 
+# --- Startup ---
+
+
+async def _warmup() -> None:
+    """Prefetch the HTML of every spec in the filtered index, concurrently."""
+    await asyncio.gather(
+        *(
+            _get_spec_html(spec.key, spec.uri)
+            for fam in get_filtered_index().values()
+            for spec in fam.specifications
+        ),
+        return_exceptions=True,
+    )
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Run the optional cache warmup (WARMUP) in the background while the server is up."""
+    task = asyncio.create_task(_warmup()) if settings.warmup else None
+    try:
+        yield {}
+    finally:
+        if task is not None:
+            # Shutdown may itself be cancelling us; shield the cleanup so it runs to the end
+            with anyio.CancelScope(shield=True):
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+                # The warmup's loads run shielded from it, so stop any still in flight too
+                loads = list(_inflight.values())
+                for load in loads:
+                    load.cancel()
+                await asyncio.gather(*loads, return_exceptions=True)
+
+
 mcp = FastMCP(
     "ld-mcp",
     instructions="""Linked Data MCP Server - Access W3C Semantic Web specifications.
@@ -35,75 +85,328 @@ Tools:
 - get_section(spec_key, section_id) → Get markdown content for a section
 - list_resources(ns_key) → List classes/properties in a namespace (rdf, rdfs, owl, sh, skos, prov)
 - get_resource(ns_key, resource, include_references?) → Get Turtle definition of a resource""",
+    lifespan=_lifespan,
 )
 
 
 # --- Helpers ---
 
+# Key → (family_key, entry) lookup tables, built from the filtered index they mirror
+_spec_by_key: dict[str, tuple[str, Specification]] = {}
+_ns_by_key: dict[str, tuple[str, Namespace]] = {}
+_lookups_source: dict | None = None
 
-def _get_spec_by_key(spec_key: str) -> tuple[str, dict] | None:
-    """Lookup spec by key → (family_key, spec_dict) or None."""
-    for fk, fam in get_filtered_index().items():
-        for spec in fam.get("specifications", []):
-            if spec.get("key") == spec_key:
-                return fk, spec
-    return None
-
-
-def _get_namespace_by_key(ns_key: str) -> tuple[str, dict] | None:
-    """Lookup namespace by key → (family_key, ns_dict) or None."""
-    for fk, fam in get_filtered_index().items():
-        for ns in fam.get("namespaces", []):
-            if ns.get("key") == ns_key:
-                return fk, ns
-    return None
+# Sorted key tuples, plus their comma-separated forms for "Unknown ..." error messages
+_all_spec_keys: tuple[str, ...] = ()
+_all_namespace_keys: tuple[str, ...] = ()
+_available_specs = ""
+_available_namespaces = ""
+_available_families = ""
 
 
-def _list_all_spec_keys() -> list[str]:
+def _build_lookups() -> None:
+    """Populate the spec/namespace lookup tables, rebuilding if the filtered index changed."""
+    global _lookups_source, _all_spec_keys, _all_namespace_keys
+    global _available_specs, _available_namespaces, _available_families
+    index = get_filtered_index()
+    if index is _lookups_source:
+        return
+    _spec_by_key.clear()
+    _ns_by_key.clear()
+    for fk, fam in index.items():
+        for spec in fam.specifications:
+            _spec_by_key[spec.key] = (fk, spec)
+        for ns in fam.namespaces:
+            _ns_by_key[ns.key] = (fk, ns)
+    _all_spec_keys = tuple(sorted(_spec_by_key))
+    _all_namespace_keys = tuple(sorted(_ns_by_key))
+    _available_specs = ", ".join(_all_spec_keys)
+    _available_namespaces = ", ".join(_all_namespace_keys)
+    _available_families = ", ".join(index.keys())
+    # The rendered overviews come from the same index, so drop them along with it
+    _overview_markdown.cache_clear()
+    _family_markdown.cache_clear()
+    _lookups_source = index
+
+
+# Index keys are short ASCII slugs; anything longer or non-ASCII is rejected without a lookup
+_MAX_KEY_LENGTH = 64
+
+
+def _get_spec_by_key(spec_key: str) -> tuple[str, Specification] | None:
+    """Lookup spec by key → (family_key, spec) or None."""
+    _build_lookups()  # Also fills the "Available: ..." strings used by callers' errors
+    if not spec_key or len(spec_key) > _MAX_KEY_LENGTH or not spec_key.isascii():
+        return None
+    return _spec_by_key.get(spec_key)
+
+
+def _get_namespace_by_key(ns_key: str) -> tuple[str, Namespace] | None:
+    """Lookup namespace by key → (family_key, ns) or None."""
+    _build_lookups()  # Also fills the "Available: ..." strings used by callers' errors
+    if not ns_key or len(ns_key) > _MAX_KEY_LENGTH or not ns_key.isascii():
+        return None
+    return _ns_by_key.get(ns_key)
+
+
+def _list_all_spec_keys() -> tuple[str, ...]:
     """All available spec keys, sorted."""
-    return sorted(
-        spec.get("key")
-        for fam in get_filtered_index().values()
-        for spec in fam.get("specifications", [])
-    )
+    _build_lookups()
+    return _all_spec_keys
 
 
-def _list_all_namespace_keys() -> list[str]:
+def _list_all_namespace_keys() -> tuple[str, ...]:
     """All available namespace keys, sorted."""
-    return sorted(
-        ns.get("key")
-        for fam in get_filtered_index().values()
-        for ns in fam.get("namespaces", [])
-    )
+    _build_lookups()
+    return _all_namespace_keys
+
+
+# In-flight loads keyed by cache key, so concurrent misses share one fetch/parse
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _single_flight(key: str, load: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """Run `load(*args)` once per key, sharing the result with concurrent callers."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(load(*args))
+        _inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if _inflight.get(key) is t:
+                del _inflight[key]
+
+        task.add_done_callback(_done)
+    # Shield so one caller being cancelled doesn't cancel the load for everyone else
+    return await asyncio.shield(task)
+
+
+async def _get_spec_html(spec_key: str, uri: str) -> bytes:
+    """Fetch and cache raw HTML for a spec (memory, then disk, then network)."""
+    if cached := cache.get(f"html:{spec_key}"):
+        return cached
+    return await _single_flight(f"html:{spec_key}", _load_spec_html, spec_key, uri)
+
+
+async def _revalidate(
+    disk_key: str, uri: str, accept: str | None = None
+) -> tuple[bytes, str | None, bytes | None]:
+    """Fetch a document whose disk entry is missing or expired, revalidating it if present.
+
+    The ETag/Last-Modified validators and a SHA-256 of each download are kept next to the
+    entry. An expired entry then costs a conditional GET, and if the origin answers 304 Not
+    Modified (or sends identical bytes) its TTL is restarted and the stored bytes returned.
+    Returns (data, media type, meta); meta is None if the stored entry is still current,
+    otherwise the caller stores the new entry and then meta with `_store_revalidated`.
+    """
+    meta_key = f"{disk_key}.meta"
+    stored = await asyncio.to_thread(disk_cache.get_stale, disk_key)
+    meta = {}
+    if stored and (raw := await asyncio.to_thread(disk_cache.get_stale, meta_key)):
+        meta = from_json(raw)
+    data, media_type, validators = await fetch_if_modified(uri, meta.get("validators"), accept)
+    digest = hashlib.sha256(data).hexdigest() if data is not None else meta.get("sha256")
+    meta_data = to_json({"validators": validators, "sha256": digest})
+    if data is None or digest == meta.get("sha256"):
+        await asyncio.to_thread(disk_cache.set, meta_key, meta_data)
+        await asyncio.to_thread(disk_cache.touch, disk_key)
+        return stored, None, None
+    return data, media_type, meta_data
+
+
+async def _store_revalidated(disk_key: str, data: bytes, meta: bytes) -> None:
+    """Store a refreshed disk entry, then its meta, so the meta never vouches for old bytes."""
+    if await asyncio.to_thread(disk_cache.set, disk_key, data):
+        await asyncio.to_thread(disk_cache.set, f"{disk_key}.meta", meta)
+
+
+async def _load_spec_html(spec_key: str, uri: str) -> bytes:
+    """Load spec HTML from the disk cache or the network."""
+    disk_key = f"html/{spec_key}.html"
+    if not disk_cache.enabled:
+        html = await fetch_html(uri)
+    elif not (html := await asyncio.to_thread(disk_cache.get, disk_key)):
+        html, _, meta = await _revalidate(disk_key, uri)
+        if meta is not None:
+            await _store_revalidated(disk_key, html, meta)
+        else:
+            # Unchanged HTML means an unchanged TOC, so the TOC parsed from it stays valid too
+            await asyncio.to_thread(disk_cache.touch, f"toc/{spec_key}.json")
+    cache.set(f"html:{spec_key}", html)
+    return html
+
+
+_UNUSED_TAGS = ("script", "style")
 
 
 async def _get_spec_soup(spec_key: str, uri: str) -> BeautifulSoup:
-    """Fetch and cache parsed HTML for a spec."""
-    if cached := cache.get(f"soup:{spec_key}"):
+    """Parse the cached HTML for a spec, keeping the tree around briefly."""
+    if cached := soup_cache.get(spec_key):
         return cached
-    soup = BeautifulSoup(await fetch_html(uri), "html.parser")
-    cache.set(f"soup:{spec_key}", soup)
+    return await _single_flight(f"soup:{spec_key}", _load_spec_soup, spec_key, uri)
+
+
+async def _load_spec_soup(spec_key: str, uri: str) -> BeautifulSoup:
+    """Parse spec HTML into a tree, dropping script/style subtrees nothing reads."""
+    soup = parse_html(await _get_spec_html(spec_key, uri))
+    # ReSpec output embeds large scripts and stylesheets; markdown conversion drops them
+    # anyway, so removing them up front shrinks the cached tree every lookup walks.
+    for tag in soup.find_all(_UNUSED_TAGS):
+        tag.decompose()
+    soup_cache.set(spec_key, soup)
     return soup
 
 
+async def _extract_section(spec_key: str, uri: str, section_id: str) -> str | None:
+    """Extract a section from the spec tree, building just that section on a first visit.
+
+    A strained parse still tokenizes the whole document, so it only pays off once: later
+    sections of the same spec come from the full tree, which is built once and cached.
+    """
+    if (soup := soup_cache.get(spec_key)) is None:
+        if md_cache.get(f"strained:{spec_key}") is None:
+            md_cache.set(f"strained:{spec_key}", True)
+            html = await _get_spec_html(spec_key, uri)
+            content = extract_section_content_html(html, section_id)
+            if content is not None:
+                return content
+        soup = await _get_spec_soup(spec_key, uri)
+    return extract_section_content(soup, section_id)
+
+
 async def _get_spec_toc(spec_key: str, uri: str) -> list:
-    """Fetch and cache TOC for a spec."""
+    """Fetch and cache TOC for a spec (persisted as JSON so restarts skip parsing)."""
     if cached := cache.get(f"toc:{spec_key}"):
         return cached
-    toc = parse_w3c_toc(await _get_spec_soup(spec_key, uri))
+    return await _single_flight(f"toc:{spec_key}", _load_spec_toc, spec_key, uri)
+
+
+async def _load_spec_toc(spec_key: str, uri: str) -> list:
+    """Load a spec TOC from the disk cache or parse it from the HTML."""
+    disk_key = f"toc/{spec_key}.json"
+    data = None
+    if disk_cache.enabled and not (data := await asyncio.to_thread(disk_cache.get, disk_key)):
+        # Reloading the HTML revalidates an expired copy (even one still held in memory),
+        # and an unchanged one restarts the stored TOC's TTL along with its own
+        await _single_flight(f"html:{spec_key}", _load_spec_html, spec_key, uri)
+        data = await asyncio.to_thread(disk_cache.get, disk_key)
+    if data:
+        toc = [TOCItem.from_cache(item) for item in from_json(data)]
+    else:
+        toc = await _parse_spec_toc(spec_key, uri)
+        if disk_cache.enabled:
+            await asyncio.to_thread(disk_cache.set, disk_key, to_json(toc))
     cache.set(f"toc:{spec_key}", toc)
     return toc
 
 
-def _get_namespace_graph(ns_key: str, uri: str):
-    """Fetch and cache RDF graph for a namespace."""
+async def _get_flat_toc(spec_key: str, uri: str) -> list[dict]:
+    """Flatten a spec TOC to depth 3 (what error previews show), caching the flat list."""
+    if cached := md_cache.get(f"flat-toc:{spec_key}"):
+        return cached
+    flat = flatten_toc(await _get_spec_toc(spec_key, uri), max_depth=3)
+    md_cache.set(f"flat-toc:{spec_key}", flat)
+    return flat
+
+
+async def _get_toc_preview(spec_key: str, uri: str) -> str:
+    """First few section ids (depth <= 3) of a spec, for "not found" errors."""
+    preview = md_cache.get(f"toc-preview:{spec_key}")
+    if preview is None:
+        flat = await _get_flat_toc(spec_key, uri)
+        preview = ", ".join(item["id"] for item in flat[:10])
+        md_cache.set(f"toc-preview:{spec_key}", preview)
+    return preview
+
+
+async def _parse_spec_toc(spec_key: str, uri: str) -> list:
+    """Parse a spec TOC, reusing a cached tree or else building only the TOC subtree."""
+    if soup := soup_cache.get(spec_key):
+        return parse_w3c_toc(soup)
+    toc = parse_w3c_toc_html(await _get_spec_html(spec_key, uri))
+    if toc is None:
+        toc = parse_w3c_toc(await _get_spec_soup(spec_key, uri))
+    return toc
+
+
+async def _get_namespace_graph(ns_key: str, uri: str):
+    """Fetch and cache RDF graph for a namespace (parsed off the event loop)."""
     if cached := cache.get(f"graph:{ns_key}"):
         return cached
-    graph = fetch_namespace_graph(uri)
+    return await _single_flight(f"graph:{ns_key}", _load_namespace_graph, ns_key, uri)
+
+
+async def _load_namespace_graph(ns_key: str, uri: str):
+    """Load a namespace graph from the disk cache (N-Triples) or fetch it, parsing off the loop."""
+    disk_key = f"graph/{ns_key}.nt"
+    if not disk_cache.enabled:
+        data, media_type = await fetch_rdf(uri)
+        graph = await asyncio.to_thread(parse_namespace_graph, data, uri, media_type)
+    elif data := await asyncio.to_thread(disk_cache.get, disk_key):
+        graph = await asyncio.to_thread(graph_from_ntriples, data)
+    else:
+        data, media_type, meta = await _revalidate(disk_key, uri, RDF_ACCEPT)
+        if meta is None:  # Still current, so the stored N-Triples are too
+            graph = await asyncio.to_thread(graph_from_ntriples, data)
+        else:
+            graph = await asyncio.to_thread(parse_namespace_graph, data, uri, media_type)
+            data = await asyncio.to_thread(graph_to_ntriples, graph)
+            await _store_revalidated(disk_key, data, meta)
     cache.set(f"graph:{ns_key}", graph)
     return graph
 
 
+async def _get_namespace_resources(ns_key: str, uri: str) -> list[Resource]:
+    """Extract and cache the resources defined in a namespace."""
+    if cached := cache.get(f"resources:{ns_key}"):
+        return cached
+    resources = extract_resources(await _get_namespace_graph(ns_key, uri), uri)
+    cache.set(f"resources:{ns_key}", resources)
+    return resources
+
+
+@lru_cache(maxsize=1)
+def _overview_markdown() -> str:
+    """Render the family overview (built once per filtered index, see `_build_lookups`)."""
+    lines = ["# Linked Data Specifications", ""]
+    for key, data in get_filtered_index().items():
+        spec_count = len(data.specifications)
+        ns_count = len(data.namespaces)
+        ns_part = f", {ns_count} namespace{'s' if ns_count != 1 else ''}" if ns_count else ""
+        lines.append(
+            f"- {key} ({spec_count} spec{'s' if spec_count != 1 else ''}{ns_part}): {data.comment}"
+        )
+
+    lines.append("\nHint: Use `list_specifications(family)` to see available specifications and namespaces.")
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _family_markdown(family_upper: str) -> str:
+    """Render the details of a known family (built once per family and filtered index)."""
+    family_data = get_filtered_index()[family_upper]
+    lines = [f"# {family_upper}", "", family_data.comment]
+
+    specs = family_data.specifications
+    if specs:
+        lines.append("")
+        lines.append("## Specifications")
+        for s in specs:
+            lines.append(f"- `{s.key}`: {s.comment}")
+
+    namespaces = family_data.namespaces
+    if namespaces:
+        lines.append("")
+        lines.append("## Namespaces")
+        for n in namespaces:
+            lines.append(f"- `{n.key}`: {n.comment}")
+
+    lines.append("\nHint: Use `list_sections(spec_key, depth)` to see available sections for a specification and `list_resources(ns_key)` to see available resources for a namespace.")
+
+    return "\n".join(lines)
+
+
 # --- Tools ---
 
 
@@ -114,48 +417,14 @@ async def list_specifications(
     ] = None,
 ) -> str:
     """List available specification families or get details for a specific family."""
-    index = get_filtered_index()
-
+    _build_lookups()  # Rebuilds (and clears the rendered overviews) if the index changed
     if family:
         family_upper = family.upper()
-        if family_upper not in index:
-            available = ", ".join(index.keys())
-            raise ToolError(f"Unknown family '{family}'. Available: {available}")
-
-        family_data = index[family_upper]
-        lines = [f"# {family_upper}", "", family_data.get("comment", "")]
-
-        specs = family_data.get("specifications", [])
-        if specs:
-            lines.append("")
-            lines.append("## Specifications")
-            for s in specs:
-                lines.append(f"- `{s['key']}`: {s['comment']}")
-
-        namespaces = family_data.get("namespaces", [])
-        if namespaces:
-            lines.append("")
-            lines.append("## Namespaces")
-            for n in namespaces:
-                lines.append(f"- `{n['key']}`: {n['comment']}")
-
-        lines.append("\nHint: Use `list_sections(spec_key, depth)` to see available sections for a specification and `list_resources(ns_key)` to see available resources for a namespace.")
-
-        return "\n".join(lines)
+        if family_upper not in get_filtered_index():
+            raise ToolError(f"Unknown family '{family}'. Available: {_available_families}")
+        return _family_markdown(family_upper)
 
-    # Overview of all families
-    lines = ["# Linked Data Specifications", ""]
-    for key, data in index.items():
-        spec_count = len(data.get("specifications", []))
-        ns_count = len(data.get("namespaces", []))
-        ns_part = f", {ns_count} namespace{'s' if ns_count != 1 else ''}" if ns_count else ""
-        lines.append(
-            f"- {key} ({spec_count} spec{'s' if spec_count != 1 else ''}{ns_part}): {data.get('comment', '')}"
-        )
-
-    lines.append("\nHint: Use `list_specifications(family)` to see available specifications and namespaces.")
-
-    return "\n".join(lines)
+    return _overview_markdown()
 
 
 @mcp.tool()
@@ -166,13 +435,16 @@ async def list_sections(
     """Get the table of contents for a specification document."""
     spec_info = _get_spec_by_key(spec_key)
     if not spec_info:
-        available = ", ".join(_list_all_spec_keys())
-        raise ToolError(f"Unknown spec '{spec_key}'. Available: {available}")
+        raise ToolError(f"Unknown spec '{spec_key}'. Available: {_available_specs}")
 
     family_key, spec = spec_info
 
+    md_key = f"sections-md:{spec_key}:{depth}"
+    if cached := md_cache.get(md_key):
+        return cached
+
     try:
-        toc = await _get_spec_toc(spec_key, spec["uri"])
+        toc = await _get_spec_toc(spec_key, spec.uri)
     except Exception as e:
         raise ToolError(f"Failed to fetch spec: {str(e)}")
 
@@ -180,15 +452,16 @@ async def list_sections(
         raise ToolError(f"No table of contents found in {spec_key}")
 
     # Format as indented markdown links
+    # The rendered listing is cached per depth already, so no need to keep the flat list
     flat = flatten_toc(toc, max_depth=depth)
     lines = [f"# {spec_key}", ""]
-    for item in flat:
-        indent = "\t" * (item["depth"] - 1)
-        lines.append(f"{indent}[{item['title']}]({item['id']})")
+    lines.extend("\t" * (item["depth"] - 1) + f"[{item['title']}]({item['id']})" for item in flat)
 
     lines.append("\nHint: Use `get_section(spec_key, section_id)` to get the markdown content of a specific section.")
 
-    return "\n".join(lines)
+    result = "\n".join(lines)
+    md_cache.set(md_key, result)
+    return result
 
 
 @mcp.tool()
@@ -199,24 +472,24 @@ async def get_section(
     """Get the markdown content of a specific section from a specification."""
     spec_info = _get_spec_by_key(spec_key)
     if not spec_info:
-        available = ", ".join(_list_all_spec_keys())
-        raise ToolError(f"Unknown spec '{spec_key}'. Available: {available}")
+        raise ToolError(f"Unknown spec '{spec_key}'. Available: {_available_specs}")
 
     family_key, spec = spec_info
 
+    md_key = f"section-md:{spec_key}:{section_id}"
+    if cached := md_cache.get(md_key):
+        return cached
+
     try:
-        soup = await _get_spec_soup(spec_key, spec["uri"])
+        content = await _extract_section(spec_key, spec.uri, section_id)
     except Exception as e:
         raise ToolError(f"Failed to fetch spec: {str(e)}")
 
-    content = extract_section_content(soup, section_id)
-
     if not content:
-        toc = await _get_spec_toc(spec_key, spec["uri"])
-        flat = flatten_toc(toc, max_depth=3)
-        available = ", ".join(item["id"] for item in flat[:10])
+        available = await _get_toc_preview(spec_key, spec.uri)
         raise ToolError(f"Section '{section_id}' not found. Available: {available}...")
 
+    md_cache.set(md_key, content)
     return content
 
 
@@ -227,36 +500,37 @@ async def list_resources(
     """List all resources (classes, properties) defined in a namespace."""
     ns_info = _get_namespace_by_key(ns_key)
     if not ns_info:
-        available = ", ".join(_list_all_namespace_keys())
-        raise ToolError(f"Unknown namespace '{ns_key}'. Available: {available}")
+        raise ToolError(f"Unknown namespace '{ns_key}'. Available: {_available_namespaces}")
 
     family_key, ns = ns_info
 
+    md_key = f"resources-md:{ns_key}"
+    if cached := md_cache.get(md_key):
+        return cached
+
     try:
-        graph = _get_namespace_graph(ns_key, ns["uri"])
+        resources = await _get_namespace_resources(ns_key, ns.uri)
     except Exception as e:
         raise ToolError(f"Failed to fetch namespace: {str(e)}")
 
-    resources = extract_resources(graph, ns["uri"])
-
     if not resources:
         raise ToolError(f"No resources found in {ns_key}")
 
     # Group by type
     by_type: dict[str, list[str]] = {}
     for r in resources:
-        rtype = r.get("a") or "Other"
-        by_type.setdefault(rtype, []).append(r["name"])
+        rtype = r.a or "Other"
+        by_type.setdefault(rtype, []).append(r.name)
 
     lines = [f"# {ns_key}", ""]
     for rtype, names in sorted(by_type.items()):
-        lines.append(f"## {rtype}")
-        lines.append(", ".join(sorted(names)))
-        lines.append("")
+        lines.extend((f"## {rtype}", ", ".join(sorted(names)), ""))
 
     lines.append("\nHint: Use `get_resource(ns_key, resource)` to get the full definition of a resource.")
 
-    return "\n".join(lines).rstrip()
+    result = "\n".join(lines).rstrip()
+    md_cache.set(md_key, result)
+    return result
 
 
 @mcp.tool()
@@ -270,31 +544,37 @@ async def get_resource(
     """Get the full definition of a resource from a namespace as Turtle."""
     ns_info = _get_namespace_by_key(ns_key)
     if not ns_info:
-        available = ", ".join(_list_all_namespace_keys())
-        raise ToolError(f"Unknown namespace '{ns_key}'. Available: {available}")
+        raise ToolError(f"Unknown namespace '{ns_key}'. Available: {_available_namespaces}")
 
     family_key, ns = ns_info
 
+    md_key = f"resource-ttl:{ns_key}:{resource}:{int(include_references)}"
+    if cached := md_cache.get(md_key):
+        return cached
+
     try:
-        graph = _get_namespace_graph(ns_key, ns["uri"])
+        graph = await _get_namespace_graph(ns_key, ns.uri)
     except Exception as e:
         raise ToolError(f"Failed to fetch namespace: {str(e)}")
 
     turtle = get_resource_turtle(
-        graph, ns["uri"], resource, subject_only=not include_references
+        graph, ns.uri, resource, subject_only=not include_references
     )
 
     if not turtle:
-        resources = extract_resources(graph, ns["uri"])
-        available = ", ".join(r["name"] for r in resources[:10])
+        resources = await _get_namespace_resources(ns_key, ns.uri)
+        available = ", ".join(r.name for r in resources[:10])
         raise ToolError(f"Resource '{resource}' not found in {ns_key}. Available: {available}...")
 
+    md_cache.set(md_key, turtle)
     return turtle
 
 
 def main():
-    """Run the MCP server (stdio transport)."""
-    mcp.run()
+    """Run the MCP server (stdio transport), on uvloop when it is installed."""
+    # Same as `mcp.run()`, but lets anyio pick the faster libuv-based event loop
+    use_uvloop = importlib.util.find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+"""
+Offline tests for fetching and disk-cache revalidation (mocked origin, no network).
+
+Run with: pytest tests/test_fetch.py -v
+"""
+
+import os
+
+import httpx
+
+from ld_mcp import fetch, server
+from ld_mcp.cache import DiskCache
+
+SPEC_URI = "https://www.w3.org/TR/example/"
+SPEC_HTML = b"<html><body><h2 id='intro'>Introduction</h2></body></html>"
+
+
+async def test_expired_disk_entry_is_revalidated(tmp_path, monkeypatch):
+    """200 stores the ETag; once the entry expires, a 304 reuses the stored bytes."""
+    requests = []
+
+    def origin(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=SPEC_HTML, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(origin))
+    monkeypatch.setattr(fetch, "http_client", client)
+    # A negative TTL makes every disk entry count as expired on the next read
+    monkeypatch.setattr(server, "disk_cache", DiskCache(tmp_path, ttl=-1))
+
+    assert await server._load_spec_html("example", SPEC_URI) == SPEC_HTML
+    assert await server._load_spec_html("example", SPEC_URI) == SPEC_HTML
+    assert [r.headers.get("If-None-Match") for r in requests] == [None, '"v1"']
+    await client.aclose()
+
+
+async def test_unchanged_html_keeps_stored_toc(tmp_path, monkeypatch):
+    """When expired HTML revalidates as unchanged, the TOC stored from it is reused as is."""
+    requests = []
+
+    def origin(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=SPEC_HTML, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(origin))
+    monkeypatch.setattr(fetch, "http_client", client)
+    monkeypatch.setattr(server, "disk_cache", DiskCache(tmp_path, ttl=3600))
+    toc = await server._load_spec_toc("example", SPEC_URI)
+    assert [item.id for item in toc] == ["intro"]
+
+    # Expire both entries, and make any re-parse of the TOC fail loudly
+    for path in tmp_path.rglob("*"):
+        if path.is_file():
+            os.utime(path, (0, 0))
+    monkeypatch.setattr(server, "_parse_spec_toc", None)
+
+    assert await server._load_spec_toc("example", SPEC_URI) == toc
+    assert [r.headers.get("If-None-Match") for r in requests] == [None, '"v1"']
+    await client.aclose()
@@ -1,34 +1,48 @@
 """
 Validate all specifications and namespaces defined in index.yaml.
 
-Run with: pytest tests/test_index.py -v
+Run with: pytest tests/test_index.py -n auto -v
 """
 
 import httpx
 import pytest
-from bs4 import BeautifulSoup
-from rdflib import Graph
 
 from ld_mcp.config import load_index
-from ld_mcp.parsers import NAMESPACES, extract_section_content, flatten_toc, parse_w3c_toc
+from ld_mcp.fetch import RDF_ACCEPT, media_type, parse_html
+from ld_mcp.parsers import (
+    extract_section_content,
+    extract_section_content_html,
+    parse_namespace_graph,
+    parse_w3c_toc,
+    parse_w3c_toc_html,
+)
 
 # --- Dynamic test generation from index.yaml ---
 
 
-def _get_all_specs():
-    """Generate (spec_key, uri) pairs from index.yaml."""
-    index = load_index()
-    for family_data in index.values():
-        for spec in family_data.get("specifications", []):
-            yield pytest.param(spec["key"], spec["uri"], id=spec["key"])
+def _index_params(kind: str) -> list:
+    """(key, uri) params for every entry of one kind ("specifications"/"namespaces")."""
+    return [
+        pytest.param(item["key"], item["uri"], id=item["key"])
+        for family_data in load_index().values()
+        for item in family_data.get(kind, [])
+    ]
 
 
-def _get_all_namespaces():
-    """Generate (ns_key, uri) pairs from index.yaml."""
-    index = load_index()
-    for family_data in index.values():
-        for ns in family_data.get("namespaces", []):
-            yield pytest.param(ns["key"], ns["uri"], id=ns["key"])
+# TOCs and the first sections sit near the top of every spec, so huge pages are cut short
+MAX_SPEC_BYTES = 2_000_000
+
+
+def _get_capped(client: httpx.Client, uri: str) -> tuple[int, bytes]:
+    """GET a URL, reading at most MAX_SPEC_BYTES of the (decompressed) body."""
+    with client.stream("GET", uri) as response:
+        chunks, total = [], 0
+        for chunk in response.iter_bytes(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_SPEC_BYTES:
+                break
+        return response.status_code, b"".join(chunks)
 
 
 # --- Fixtures ---
@@ -38,7 +52,14 @@ def _get_all_namespaces():
 def http_client():
     """Shared HTTP client for all tests."""
     client = httpx.Client(
-        timeout=30.0, follow_redirects=True, headers={"User-Agent": "ld-mcp-test/1.0"}
+        http2=True,
+        # Stalled connects fail fast; reads are per-chunk, so large specs still stream fine
+        timeout=httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=5.0),
+        limits=httpx.Limits(
+            max_connections=50, max_keepalive_connections=50, keepalive_expiry=60.0
+        ),
+        follow_redirects=True,
+        headers={"User-Agent": "ld-mcp-test/1.0"},
     )
     yield client
     client.close()
@@ -47,28 +68,30 @@ def http_client():
 # --- Tests ---
 
 
-@pytest.mark.parametrize("spec_key,spec_uri", list(_get_all_specs()))
+@pytest.mark.parametrize("spec_key,spec_uri", _index_params("specifications"))
 def test_spec(http_client, spec_key, spec_uri):
     """Validate spec: fetch, parse TOC, extract first section."""
-    response = http_client.get(spec_uri)
-    assert response.status_code == 200, f"HTTP {response.status_code}"
+    status, html = _get_capped(http_client, spec_uri)
+    assert status == 200, f"HTTP {status}"
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse_html(html)
     toc = parse_w3c_toc(soup)
     assert toc, "No TOC found"
+    assert parse_w3c_toc_html(html) in (None, toc), "Strained TOC differs from full parse"
 
-    flat = flatten_toc(toc, max_depth=2)
-    assert flat, "TOC empty after flatten"
-
-    content = extract_section_content(soup, flat[0]["id"])
+    # The first entry of a (depth-limited) flattened TOC is always the first top-level item
+    content = extract_section_content(soup, toc[0].id)
     assert content and len(content) > 50, "Content extraction failed"
+    assert extract_section_content_html(html, toc[0].id) in (None, content), (
+        "Strained section differs from full parse"
+    )
 
 
-@pytest.mark.parametrize("ns_key,ns_uri", list(_get_all_namespaces()))
-def test_namespace(ns_key, ns_uri):
+@pytest.mark.parametrize("ns_key,ns_uri", _index_params("namespaces"))
+def test_namespace(http_client, ns_key, ns_uri):
     """Validate namespace: fetch and parse RDF."""
-    g = Graph()
-    for prefix, ns in NAMESPACES.items():
-        g.bind(prefix, ns)
-    g.parse(ns_uri)
+    response = http_client.get(ns_uri, headers={"Accept": RDF_ACCEPT})
+    assert response.status_code == 200, f"HTTP {response.status_code}"
+
+    g = parse_namespace_graph(response.content, ns_uri, media_type(response))
     assert len(g) > 0, "No triples found"
@@ -0,0 +1,109 @@
+"""
+Offline tests for namespace parsing and serialization (no network).
+
+Run with: pytest tests/test_namespace.py -v
+"""
+
+import pytest
+from rdflib import Graph, URIRef
+
+from ld_mcp.parsers import namespace
+from ld_mcp.parsers.namespace import (
+    _new_graph,
+    _rdf_format,
+    _write_turtle,
+    get_resource_turtle,
+    parse_namespace_graph,
+)
+
+SH = "http://www.w3.org/ns/shacl#"
+
+
+@pytest.mark.parametrize(
+    "head,expected",
+    [
+        (b'<?xml version="1.0"?>\n<rdf:RDF>', "xml"),
+        (b"\xef\xbb\xbf<rdf:RDF xmlns:rdf='x'>", "xml"),
+        (b"<!DOCTYPE rdf:RDF [ ]>\n<rdf:RDF>", "xml"),
+        (b'{"@context": {}}', "json-ld"),
+        (b"<http://a> <http://b> <http://c> .", None),  # Turtle/N-Triples
+        (b"<!DOCTYPE html>\n<html><body>Not found</body></html>", None),
+        (b'<?xml version="1.0"?>\n<html xmlns="http://www.w3.org/1999/xhtml">', None),
+    ],
+)
+def test_rdf_format_sniffs_vague_media_types(head, expected):
+    """Without a usable media type or extension, the payload's opening picks the parser."""
+    assert _rdf_format("text/plain", SH, head) == expected
+
+
+# A SHACL-like vocabulary covering the term shapes `_write_turtle` lays out itself
+FIXTURE = """
+@prefix dct: <http://purl.org/dc/terms/> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+sh: a owl:Ontology ;
+    rdfs:label "W3C Shapes Constraint Language (SHACL) Vocabulary"@en ;
+    dct:created "2017-07-20"^^xsd:date .
+
+sh:Shape a rdfs:Class ;
+    rdfs:label "Shape"@en ;
+    rdfs:comment "A shape is a collection of constraints that may be targeted for certain nodes."@en ;
+    rdfs:subClassOf rdfs:Resource ;
+    rdfs:isDefinedBy sh: .
+
+sh:NodeShape a rdfs:Class ;
+    rdfs:label "Node shape"@en ;
+    rdfs:comment \"\"\"A node shape is a shape that specifies constraint
+that need to be met with respect to focus nodes.\"\"\"@en ;
+    rdfs:subClassOf sh:Shape .
+
+sh:minCount a rdf:Property ;
+    rdfs:label "min count"@en ;
+    rdfs:domain sh:PropertyShape, sh:NodeShape ;
+    rdfs:range xsd:integer ;
+    sh:defaultValue 0, 1.5, true ;
+    sh:message "tab\\there \\"quoted\\" é" .
+
+sh:PropertyShape a rdfs:Class ;
+    rdfs:subClassOf sh:Shape .
+"""
+
+
+def _rdflib_turtle(triples) -> str:
+    """The reference layout: rdflib's own serializer, minus the @prefix header."""
+    g = _new_graph()
+    for triple in triples:
+        g.add(triple)
+    return g.serialize(format="turtle").partition("\n\n")[2].strip()
+
+
+@pytest.fixture(scope="module")
+def fixture_graph() -> Graph:
+    return parse_namespace_graph(FIXTURE.encode("utf-8"), SH, "text/turtle")
+
+
+@pytest.mark.parametrize("local_name", ["", "Shape", "NodeShape", "minCount", "PropertyShape"])
+@pytest.mark.parametrize("subject_only", [True, False])
+def test_write_turtle_matches_rdflib(fixture_graph, local_name, subject_only):
+    """The hand-written Turtle must stay identical to rdflib's serializer output."""
+    uri = URIRef(SH + local_name)
+    triples = list(fixture_graph.triples((uri, None, None)))
+    if not subject_only:
+        triples += fixture_graph.triples((None, uri, None))
+        triples += fixture_graph.triples((None, None, uri))
+    triples = list(dict.fromkeys(triples))
+
+    turtle = _write_turtle(triples)
+    assert turtle is not None, "Fell back to rdflib; the comparison would be vacuous"
+    assert turtle == _rdflib_turtle(triples)
+
+
+def test_turtle_falls_back_without_private_literal_writer(fixture_graph, monkeypatch):
+    """If rdflib drops Literal._literal_n3, resources are still serialized by rdflib."""
+    expected = get_resource_turtle(fixture_graph, SH, "minCount")
+    monkeypatch.setattr(namespace, "_LITERAL_N3", None)
+    assert get_resource_turtle(fixture_graph, SH, "minCount") == expected
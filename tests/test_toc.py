@@ -0,0 +1,100 @@
+"""
+Offline tests for TOC parsing (no network).
+
+Run with: pytest tests/test_toc.py -v
+"""
+
+import pytest
+
+from ld_mcp.fetch import parse_html
+from ld_mcp.parsers import flatten_toc, parse_w3c_toc, parse_w3c_toc_html
+from ld_mcp.parsers.toc import _parse_toc_list
+
+ID_CONTAINER = """<html><body>
+<nav id="toc"><h2>Table of Contents</h2><ol class="toc">
+  <li><a href="#intro">1. Introduction</a>
+    <ol><li><a href="#scope">1.1 Scope</a></li></ol></li>
+  <li><a href="#model">2. Model</a></li>
+</ol></nav>
+<section id="intro"><h2>1. Introduction</h2><p>Text.</p></section>
+</body></html>"""
+
+CLASS_CONTAINER = """<html><body>
+<div class="head"><h1>Spec</h1></div>
+<div class="toc"><ul>
+  <li><a href="#terms">Terms</a></li>
+  <li><a href="#syntax">Syntax</a></li>
+</ul></div>
+</body></html>"""
+
+NO_CONTAINER = """<html><body>
+<section id="intro"><h2>Introduction</h2><p>Text.</p></section>
+<section id="model"><h2>Model</h2><p>Text.</p></section>
+</body></html>"""
+
+
+@pytest.mark.parametrize("html", [ID_CONTAINER, CLASS_CONTAINER], ids=["id", "class"])
+def test_strained_toc_matches_full_parse(html):
+    """The strained parse of a TOC container gives the same TOC as the full document."""
+    toc = parse_w3c_toc_html(html)
+    assert toc
+    assert toc == parse_w3c_toc(parse_html(html))
+
+
+def test_strained_toc_without_container_defers_to_full_parse():
+    """Without a TOC container there is nothing to strain; the full parse falls back."""
+    assert parse_w3c_toc_html(NO_CONTAINER) is None
+    assert [item.id for item in parse_w3c_toc(parse_html(NO_CONTAINER))] == ["intro", "model"]
+
+
+NESTED_LIST = """<ol>
+  <li><a href="#intro">1. Introduction</a>
+    <ol>
+      <li><a href="#scope">1.1 Scope</a>
+        <ul><li><a href="#scope-out">1.1.1 Out of scope</a></li></ul></li>
+      <li><span class="secno">1.2</span> <span><a href="#terms">Terms</a></span></li>
+    </ol></li>
+  <li><a href="other.html#model">2. Data Model</a></li>
+  <li><a href="#ack">Acknowledgments</a></li>
+  <li><a href="#appendix">A. Changes</a></li>
+</ol>"""
+
+
+@pytest.fixture
+def nested_toc():
+    return _parse_toc_list(parse_html(NESTED_LIST).find("ol"))
+
+
+def test_parse_toc_list_builds_nested_items(nested_toc):
+    """Direct links win, wrapped links are found, off-page links get slug ids."""
+    assert [item.id for item in nested_toc] == ["intro", "2-data-model"]
+    intro, model = nested_toc
+    assert [(child.id, child.depth) for child in intro.children] == [("scope", 2), ("terms", 2)]
+    # The item's own (direct) link, not the first link of its nested list
+    assert intro.children[0].title == "1.1 Scope"
+    assert [(c.id, c.depth) for c in intro.children[0].children] == [("scope-out", 3)]
+    # No direct <a>, so the link is found among the item's descendants
+    assert intro.children[1].anchor == "terms"
+    assert model.anchor is None
+
+
+def test_parse_toc_list_keeps_acknowledgements_on_request():
+    """Appendix and acknowledgments entries are skipped by default only."""
+    toc = _parse_toc_list(parse_html(NESTED_LIST).find("ol"), skip_acknowledgements=False)
+    assert [item.id for item in toc] == ["intro", "2-data-model", "ack", "appendix"]
+
+
+@pytest.mark.parametrize(
+    "max_depth,expected",
+    [
+        (None, ["intro", "scope", "scope-out", "terms", "2-data-model"]),
+        (0, []),
+        (1, ["intro", "2-data-model"]),
+        (2, ["intro", "scope", "terms", "2-data-model"]),
+    ],
+)
+def test_flatten_toc_in_document_order(nested_toc, max_depth, expected):
+    """Flattening walks depth-first and prunes levels below max_depth."""
+    flat = flatten_toc(nested_toc, max_depth)
+    assert [entry["id"] for entry in flat] == expected
+    assert all(max_depth is None or entry["depth"] <= max_depth for entry in flat)